@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
-import plotly.graph_objects as go
 from dash import (
     Dash,
     Input,
@@ -24,8 +25,7 @@ from flask_caching import Cache
 
 from rizzk.core.data import load_source
 from rizzk.core.journal import add_entry, list_entries
-from rizzk.core.news import fetch_news
-from rizzk.core.util import humanize_timestamp
+from rizzk.core.util import humanize_timestamps
 
 ENV_TEMPLATE = (
     "ALPACA_KEY=\n"
@@ -40,16 +40,15 @@ if not ENV_PATH.exists():
 
 load_dotenv()
 
-CACHE_DIR = Path(".cache")
-CACHE_DIR.mkdir(exist_ok=True)
-
 server = Flask(__name__)
+# Values are pickled into process memory, so every hit returns a fresh copy.
+# Multi-worker deployments should point this at a shared RedisCache instead.
 cache = Cache(
     server,
     config={
-        "CACHE_TYPE": "FileSystemCache",
-        "CACHE_DIR": str(CACHE_DIR),
+        "CACHE_TYPE": "SimpleCache",
         "CACHE_DEFAULT_TIMEOUT": 300,
+        "CACHE_THRESHOLD": 1024,
     },
 )
 
@@ -73,6 +72,11 @@ app = _create_dash_app(server)
 source = load_source()
 DEFAULT_SYMBOL = "AAPL"
 SYMBOLS = ["AAPL", "MSFT", "GOOGL", "TSLA", "AMZN", "NVDA", "META"]
+SYMBOL_OPTIONS = [{"label": sym, "value": sym} for sym in SYMBOLS]
+SYMBOL_SET = frozenset(SYMBOLS)
+SCREENER_COLUMNS = ["Symbol", "Close", "RSI", "EMA20", "ATR"]
+MAX_PLOT_POINTS = 2000
+PRICE_POOL = ThreadPoolExecutor(max_workers=min(8, len(SYMBOLS)), thread_name_prefix="prices")
 
 
 def serve_layout() -> html.Div:
@@ -91,7 +95,7 @@ def serve_layout() -> html.Div:
                     html.Label("Symbol"),
                     dcc.Dropdown(
                         id="symbol",
-                        options=[{"label": sym, "value": sym} for sym in SYMBOLS],
+                        options=SYMBOL_OPTIONS,
                         value=DEFAULT_SYMBOL,
                         clearable=False,
                     ),
@@ -119,25 +123,49 @@ def serve_layout() -> html.Div:
 app.layout = serve_layout
 
 
-@cache.memoize()
 def get_prices(symbol: str) -> pd.DataFrame:
-    df = source.get_ohlc(symbol, days=200).copy()
-    df.sort_values("date", inplace=True)
+    """Return the sorted price history for *symbol*."""
+    return _prices_for_day(symbol, trading_day())
+
+
+def trading_day() -> str:
+    """Return the current UTC date, the key under which daily data is cached."""
+    return datetime.now(UTC).date().isoformat()
+
+
+@cache.memoize(timeout=86400)
+def _prices_for_day(symbol: str, day: str) -> pd.DataFrame:
+    df = source.get_ohlc(symbol, days=200)
+    if not df["date"].is_monotonic_increasing:
+        df.sort_values("date", inplace=True)
     return df
 
 
-@cache.memoize(timeout=600)
 def get_news() -> list[dict[str, str]]:
+    from rizzk.core.news import fetch_news
+
     try:
         return fetch_news(limit=40)
     except Exception as exc:  # pragma: no cover - network failure path
         return [{"source": "Error", "title": str(exc), "link": ""}]
 
 
+def plot_slice(n: int) -> slice:
+    """Select at most ``MAX_PLOT_POINTS`` evenly strided bars, always ending on the last."""
+    stride = max(1, -(-n // MAX_PLOT_POINTS))
+    return slice((n - 1) % stride, None, stride)
+
+
 def make_prices_tab(symbol: str) -> html.Div:
+    import plotly.graph_objects as go
+
     df = get_prices(symbol)
+    keep = plot_slice(len(df))
+    dates = df["date"].to_numpy(dtype="datetime64[ms]")[keep]
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=df["date"], y=df["close"], mode="lines", name=symbol))
+    fig.add_trace(
+        go.Scattergl(x=dates, y=df["close"].to_numpy(np.float32)[keep], mode="lines", name=symbol)
+    )
     fig.update_layout(
         template="plotly_dark",
         margin=dict(l=30, r=30, t=30, b=30),
@@ -147,39 +175,42 @@ def make_prices_tab(symbol: str) -> html.Div:
     return html.Div([dcc.Graph(figure=fig)])
 
 
-def build_screener(symbols: list[str]) -> pd.DataFrame:
-    rows: list[dict[str, Any]] = []
-    for sym in symbols:
-        df = get_prices(sym).copy()
-        indicators = df.copy()
-        indicators["rsi"] = ta.rsi(indicators["close"], length=14)
-        indicators["ema20"] = ta.ema(indicators["close"], length=20)
-        indicators["atr"] = ta.atr(
-            high=indicators["high"],
-            low=indicators["low"],
-            close=indicators["close"],
-            length=14,
-        )
-        indicators.dropna(inplace=True)
-        if indicators.empty:
-            continue
-        last = indicators.iloc[-1]
-        rows.append(
-            {
-                "Symbol": sym,
-                "Close": round(float(last["close"]), 2),
-                "RSI": round(float(last["rsi"]), 2),
-                "EMA20": round(float(last["ema20"]), 2),
-                "ATR": round(float(last["atr"]), 2),
-            }
-        )
-    return pd.DataFrame(rows)
+@cache.memoize(timeout=60)
+def build_screener(symbols: tuple[str, ...]) -> pd.DataFrame:
+    from rizzk.core.indicators import latest_indicators
+
+    if not symbols:
+        return pd.DataFrame(columns=SCREENER_COLUMNS)
+    frames = list(PRICE_POOL.map(get_prices, symbols))
+    # Rows are left-aligned; each symbol is computed over its own history only.
+    lengths = np.array([len(df) for df in frames], dtype=np.int64)
+    width = int(lengths.max())
+    close, high, low = (np.full((len(frames), width), np.nan) for _ in range(3))
+    for row, df in enumerate(frames):
+        n = lengths[row]
+        close[row, :n] = df["close"].to_numpy(dtype=np.float64)
+        high[row, :n] = df["high"].to_numpy(dtype=np.float64)
+        low[row, :n] = df["low"].to_numpy(dtype=np.float64)
+    rsi_last, ema_last, atr_last = latest_indicators(
+        close, high, low, rsi_win=14, ema_win=20, atr_win=14, lengths=lengths
+    )
+    last_close = np.array([close[row, n - 1] if n else np.nan for row, n in enumerate(lengths)])
+    table = pd.DataFrame(
+        {
+            "Symbol": list(symbols),
+            "Close": last_close,
+            "RSI": rsi_last,
+            "EMA20": ema_last,
+            "ATR": atr_last,
+        }
+    )
+    return table.dropna().round(2).reset_index(drop=True)
 
 
 def make_screener_tab(symbols: list[str]) -> html.Div:
-    table_df = build_screener(symbols)
+    table_df = build_screener(tuple(symbols))
     if table_df.empty:
-        table_df = pd.DataFrame(columns=["Symbol", "Close", "RSI", "EMA20", "ATR"])
+        table_df = pd.DataFrame(columns=SCREENER_COLUMNS)
     return html.Div(
         [
             html.P("Sortable market metrics for watchlist symbols."),
@@ -198,13 +229,10 @@ def make_screener_tab(symbols: list[str]) -> html.Div:
 
 def format_journal_rows(limit: int = 50) -> list[dict[str, str]]:
     entries = list_entries(limit=limit)
+    stamps = humanize_timestamps([entry["ts"] for entry in entries])
     return [
-        {
-            "id": str(entry["id"]),
-            "timestamp": humanize_timestamp(entry["ts"]),
-            "body": entry["body"],
-        }
-        for entry in entries
+        {"id": str(entry["id"]), "timestamp": stamp, "body": entry["body"]}
+        for entry, stamp in zip(entries, stamps, strict=True)
     ]
 
 
@@ -338,7 +366,7 @@ def update_prefs(symbol: str, data: dict | None) -> dict:
 
 @app.callback(Output("symbol", "value"), Input("prefs", "data"))
 def load_prefs(data: dict | None) -> str:
-    if data and data.get("symbol") in SYMBOLS:
+    if data and data.get("symbol") in SYMBOL_SET:
         return data["symbol"]
     return DEFAULT_SYMBOL
 
@@ -1,5 +1,20 @@
 """Core functionality for the Rizzk Terminal."""
 
-from . import data, journal, news, settings, util
+from __future__ import annotations
 
-__all__ = ["data", "journal", "news", "settings", "util"]
+import importlib
+from types import ModuleType
+
+__all__ = ["data", "db", "indicators", "journal", "news", "settings", "util"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
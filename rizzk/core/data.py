@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import zlib
 from dataclasses import dataclass
 from functools import lru_cache
 
@@ -21,26 +22,44 @@ class DataSource:
         raise NotImplementedError
 
 
+@lru_cache(maxsize=64)
+def _ohlc_arrays(symbol: str, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Generate the demo ``(open, close, high, low)`` block and volumes for *symbol*.
+
+    The arrays are cached, so they are returned read-only; callers copy them
+    into each frame they build.
+    """
+    # crc32 is stable across processes, unlike the salted built-in str hash.
+    rng = np.random.default_rng(zlib.crc32(symbol.encode()))
+    normal = rng.standard_normal((3, n), dtype=np.float32)
+    spread = rng.random((2, n), dtype=np.float32)
+    base = (0.2 + 1.5 * normal[0]).cumsum(dtype=np.float32) + 100
+    prices = np.empty((4, n), dtype=np.float32)
+    np.multiply(normal[1:], 0.6, out=prices[:2])
+    np.multiply(spread, 2, out=prices[2:])
+    prices[3] *= -1
+    prices += base
+    volume = rng.integers(1_000_000, 5_000_000, n)
+    prices.flags.writeable = False
+    volume.flags.writeable = False
+    return prices, volume
+
+
 class YFinanceSource(DataSource):
     """Temporary in-memory price generator used for demos and tests."""
 
     def get_ohlc(self, symbol: str, days: int = 200) -> pd.DataFrame:
         periods = max(days, 30)
         idx = pd.date_range(end=pd.Timestamp.today(), periods=periods, freq="D")
-        rng = np.random.default_rng(abs(hash(symbol)) % (2**32))
-        base = rng.normal(loc=0.2, scale=1.5, size=len(idx)).cumsum() + 100
-        high = base + rng.random(len(idx)) * 2
-        low = base - rng.random(len(idx)) * 2
-        open_ = base + rng.normal(0, 0.6, len(idx))
-        close = base + rng.normal(0, 0.6, len(idx))
+        prices, volume = _ohlc_arrays(symbol, len(idx))
         return pd.DataFrame(
             {
                 "date": idx,
-                "open": open_,
-                "high": high,
-                "low": low,
-                "close": close,
-                "volume": rng.integers(1_000_000, 5_000_000, len(idx)),
+                "open": prices[0],
+                "high": prices[2],
+                "low": prices[3],
+                "close": prices[1],
+                "volume": volume,
             }
         )
 
@@ -0,0 +1,115 @@
+"""Shared SQLite connection handling."""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+class ConnectionPool:
+    """One serialised writer plus a bounded set of read-only connections.
+
+    WAL mode lets readers run alongside the writer, so reads never queue behind
+    a write. Reader handles are opened lazily, up to *readers* of them.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        readers: int = 4,
+        init: Callable[[sqlite3.Connection], None] | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self._writer = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        for pragma in PRAGMAS:
+            self._writer.execute(pragma)
+        if init is not None:
+            init(self._writer)
+        self._write_lock = threading.Lock()
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=readers)
+        self._capacity = readers
+        self._opened = 0
+        self._open_lock = threading.Lock()
+        self._probe: sqlite3.Connection | None = None
+        self._probe_lock = threading.Lock()
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = f"{self.path.resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA query_only=1")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-16000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Yield the single read-write connection while holding the write lock."""
+        with self._write_lock:
+            yield self._writer
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection, opening a new one if the pool has room."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._open_lock:
+                spare = self._opened < self._capacity
+                if spare:
+                    self._opened += 1
+            if not spare:
+                conn = self._readers.get()
+            else:
+                try:
+                    conn = self._open_reader()
+                except BaseException:
+                    # Give the slot back, or enough failures would leave get() waiting forever.
+                    with self._open_lock:
+                        self._opened -= 1
+                    raise
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def data_version(self) -> int:
+        """Return ``PRAGMA data_version`` as seen by a dedicated probe connection.
+
+        The value changes whenever any other connection commits, including this
+        pool's writer. The probe has its own lock, so it never waits on a write.
+        """
+        with self._probe_lock:
+            if self._probe is None:
+                self._probe = self._open_reader()
+            (version,) = self._probe.execute("PRAGMA data_version").fetchone()
+        return int(version)
+
+    def close(self) -> None:
+        """Close the writer, the probe and every idle reader."""
+        with self._write_lock:
+            self._writer.close()
+        with self._probe_lock:
+            if self._probe is not None:
+                self._probe.close()
+                self._probe = None
+        while True:
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._open_lock:
+                self._opened -= 1
@@ -0,0 +1,203 @@
+"""Technical indicators computed on contiguous NumPy arrays."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+
+def _as_c_f64(series: pd.Series) -> np.ndarray:
+    """Return *series* as a C-contiguous float64 array, copying only when needed."""
+    return np.ascontiguousarray(series.to_numpy(dtype=np.float64, copy=False))
+
+
+@njit(cache=True)
+def _seeded_ewm(x: np.ndarray, win: int, alpha: float) -> np.ndarray:
+    """Exponential smoothing seeded with the SMA of the first *win* values."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    if win <= 0 or n < win:
+        return out
+    acc = 0.0
+    for i in range(win):
+        acc += x[i]
+    avg = acc / win
+    out[win - 1] = avg
+    for i in range(win, n):
+        avg += alpha * (x[i] - avg)
+        out[i] = avg
+    return out
+
+
+@njit(cache=True)
+def _wilder(x: np.ndarray, win: int) -> np.ndarray:
+    """Wilder smoothing: ``avg = (avg * (win - 1) + x) / win`` after an SMA seed."""
+    return _seeded_ewm(x, win, 1.0 / win)
+
+
+@njit(cache=True)
+def _ema(x: np.ndarray, win: int) -> np.ndarray:
+    return _seeded_ewm(x, win, 2.0 / (win + 1))
+
+
+@njit(cache=True)
+def _rsi_value(avg_up: float, avg_down: float) -> float:
+    if avg_down != 0:
+        return 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+    if avg_up != 0:
+        return 100.0
+    # Flat windows (no gains and no losses) are neutral rather than overbought.
+    return 50.0
+
+
+@njit(cache=True)
+def _rsi(s: np.ndarray, win: int) -> np.ndarray:
+    n = s.shape[0]
+    up = np.zeros(max(n - 1, 0))
+    down = np.zeros(max(n - 1, 0))
+    for i in range(1, n):
+        delta = s[i] - s[i - 1]
+        if delta > 0:
+            up[i - 1] = delta
+        else:
+            down[i - 1] = -delta
+    # Wilder seeds with the mean of the first *win* price changes, so the first
+    # value lands on bar *win*, one bar after that many changes exist.
+    avg_up = _wilder(up, win)
+    avg_down = _wilder(down, win)
+    out = np.full(n, np.nan)
+    for i in range(1, n):
+        out[i] = _rsi_value(avg_up[i - 1], avg_down[i - 1])
+    return out
+
+
+@njit(cache=True)
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    n = close.shape[0]
+    out = np.empty(n)
+    if n:
+        out[0] = high[0] - low[0]
+    for i in range(1, n):
+        prev = close[i - 1]
+        out[i] = max(high[i] - low[i], abs(high[i] - prev), abs(low[i] - prev))
+    return out
+
+
+# Last-value variants used by the screener.
+
+
+@njit(cache=True)
+def _ewm_last(x: np.ndarray, win: int, alpha: float) -> float:
+    n = x.shape[0]
+    if win <= 0 or n < win:
+        return np.nan
+    avg = 0.0
+    for i in range(win):
+        avg += x[i]
+    avg /= win
+    for i in range(win, n):
+        avg += alpha * (x[i] - avg)
+    return avg
+
+
+@njit(cache=True)
+def _rsi_last(s: np.ndarray, win: int) -> float:
+    n = s.shape[0]
+    if win <= 0 or n <= win:
+        return np.nan
+    avg_up = 0.0
+    avg_down = 0.0
+    for i in range(1, n):
+        delta = s[i] - s[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = 0.0 if delta > 0 else -delta
+        if i <= win:
+            avg_up += gain / win
+            avg_down += loss / win
+        else:
+            avg_up += (gain - avg_up) / win
+            avg_down += (loss - avg_down) / win
+    return _rsi_value(avg_up, avg_down)
+
+
+@njit(cache=True)
+def _atr_last(high: np.ndarray, low: np.ndarray, close: np.ndarray, win: int) -> float:
+    n = close.shape[0]
+    if win <= 0 or n < win:
+        return np.nan
+    avg = 0.0
+    for i in range(n):
+        tr = high[i] - low[i]
+        if i:
+            prev = close[i - 1]
+            tr = max(tr, abs(high[i] - prev), abs(low[i] - prev))
+        if i < win:
+            avg += tr / win
+        else:
+            avg += (tr - avg) / win
+    return avg
+
+
+@njit(cache=True)
+def _latest_matrix(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    lengths: np.ndarray,
+    rsi_win: int,
+    ema_win: int,
+    atr_win: int,
+) -> np.ndarray:
+    rows = close.shape[0]
+    out = np.empty((3, rows))
+    for j in range(rows):
+        n = lengths[j]
+        out[0, j] = _rsi_last(close[j, :n], rsi_win)
+        out[1, j] = _ewm_last(close[j, :n], ema_win, 2.0 / (ema_win + 1))
+        out[2, j] = _atr_last(high[j, :n], low[j, :n], close[j, :n], atr_win)
+    return out
+
+
+def rsi(series: pd.Series, win: int = 14) -> pd.Series:
+    """Return the Relative Strength Index of *series* using Wilder's smoothing.
+
+    The first ``win`` values are NaN while the averages warm up.
+    """
+    return pd.Series(_rsi(_as_c_f64(series), win), index=series.index)
+
+
+def ema(series: pd.Series, win: int = 20) -> pd.Series:
+    """Return the exponential moving average of *series*, seeded with an SMA."""
+    return pd.Series(_ema(_as_c_f64(series), win), index=series.index)
+
+
+def atr(high: pd.Series, low: pd.Series, close: pd.Series, win: int = 14) -> pd.Series:
+    """Return the Average True Range using Wilder's smoothing."""
+    tr = _true_range(_as_c_f64(high), _as_c_f64(low), _as_c_f64(close))
+    return pd.Series(_wilder(tr, win), index=close.index)
+
+
+def latest_indicators(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    rsi_win: int = 14,
+    ema_win: int = 20,
+    atr_win: int = 14,
+    lengths: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the final RSI, EMA and ATR values for ``(symbols, bars)`` matrices.
+
+    Each row holds one symbol's history so the kernels walk contiguous memory.
+    Histories of different lengths are left-aligned, with *lengths* giving the
+    number of valid bars per row (all columns by default). Symbols with too
+    little history yield NaN.
+    """
+    arrays = [np.ascontiguousarray(a, dtype=np.float64) for a in (close, high, low)]
+    rows, cols = arrays[0].shape
+    if lengths is None:
+        lengths = np.full(rows, cols, dtype=np.int64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    rsi_last, ema_last, atr_last = _latest_matrix(*arrays, lengths, rsi_win, ema_win, atr_win)
+    return rsi_last, ema_last, atr_last
@@ -4,59 +4,99 @@ from __future__ import annotations
 
 import sqlite3
 import time
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from .db import ConnectionPool
+
 DATA_DIR = Path("data")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 DB_PATH = DATA_DIR / "rizzk.db"
 
+INSERT_SQL = "INSERT INTO journal(ts, body) VALUES(?, ?)"
+BATCH_SIZE = 500
+
+# Bumped on every write made through this module; keys the list_entries cache.
+_generation = 0
+
 
-def _ensure_schema() -> None:
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS journal (
-                id INTEGER PRIMARY KEY,
-                ts INTEGER NOT NULL,
-                body TEXT NOT NULL
-            )
-            """
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS journal (
+            id INTEGER PRIMARY KEY,
+            ts INTEGER NOT NULL,
+            body TEXT NOT NULL
         )
-        conn.commit()
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_journal_ts ON journal(ts)")
 
 
-_ensure_schema()
+@lru_cache(maxsize=1)
+def _pool() -> ConnectionPool:
+    """Open the journal's connection pool once, creating the schema if needed."""
+    return ConnectionPool(DB_PATH, init=_ensure_schema)
 
 
 def add_entry(text: str) -> int:
     """Persist a new journal entry and return its row id."""
-    body = (text or "").strip()
-    if not body:
+    return add_entries([text])[0]
+
+
+def add_entries(texts: Iterable[str]) -> list[int]:
+    """Persist several journal entries and return their row ids.
+
+    Entries are written in chunks of ``BATCH_SIZE`` rows, one transaction each.
+    """
+    global _generation
+    bodies = [(text or "").strip() for text in texts]
+    if not all(bodies):
         raise ValueError("Journal entry cannot be empty.")
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            "INSERT INTO journal(ts, body) VALUES(?, ?)",
-            (int(time.time()), body),
-        )
-        conn.commit()
-        return int(cursor.lastrowid)
+    ts = int(time.time())
+    ids: list[int] = []
+    with _pool().writer() as conn:
+        for start in range(0, len(bodies), BATCH_SIZE):
+            chunk = bodies[start : start + BATCH_SIZE]
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(INSERT_SQL, [(ts, body) for body in chunk])
+                (last_id,) = conn.execute("SELECT last_insert_rowid()").fetchone()
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            _generation += 1
+            # The write lock is held for the whole chunk, so rowids are consecutive.
+            ids.extend(range(last_id - len(chunk) + 1, last_id + 1))
+    return ids
 
 
-def list_entries(limit: int = 50) -> list[dict[str, Any]]:
-    """Return the newest journal entries."""
-    with sqlite3.connect(DB_PATH) as conn:
+@lru_cache(maxsize=8)
+def _recent_entries(generation: int, data_version: int, limit: int) -> tuple[dict[str, Any], ...]:
+    with _pool().reader() as conn:
         rows = conn.execute(
-            "SELECT id, ts, body FROM journal ORDER BY id DESC LIMIT ?",
+            "SELECT id, ts, body FROM journal ORDER BY ts DESC, id DESC LIMIT ?",
             (limit,),
         ).fetchall()
-    return [
-        {"id": int(row[0]), "ts": int(row[1]), "body": row[2]} for row in rows
-    ]
+    return tuple({"id": int(row[0]), "ts": int(row[1]), "body": row[2]} for row in rows)
+
+
+def list_entries(limit: int = 50) -> list[dict[str, Any]]:
+    """Return the newest journal entries.
+
+    Results are reused until the journal changes, either through this module or
+    through another connection (tracked by ``PRAGMA data_version``), so the
+    returned dicts must be treated as read-only.
+    """
+    return list(_recent_entries(_generation, _pool().data_version(), limit))
 
 
 def delete_entry(entry_id: int) -> None:
     """Remove a journal entry."""
-    with sqlite3.connect(DB_PATH) as conn:
+    global _generation
+    with _pool().writer() as conn:
         conn.execute("DELETE FROM journal WHERE id = ?", (int(entry_id),))
-        conn.commit()
+        _generation += 1
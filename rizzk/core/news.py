@@ -2,29 +2,104 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 
-import feedparser
+import requests
+from requests.adapters import HTTPAdapter, Retry
 
 FEEDS: dict[str, str] = {
     "MarketWatch": "https://feeds.a.dj.com/rss/RSSMarketsMain.xml",
     "Yahoo Finance": "https://finance.yahoo.com/news/rssindex",
     "Investing.com": "https://www.investing.com/rss/news.rss",
 }
+NEWS_TTL = 600.0
+ITEMS_PER_FEED = 15
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+SESSION = requests.Session()
+SESSION.headers["Accept-Encoding"] = "gzip"
+SESSION.headers["User-Agent"] = "rizzk-terminal/0.1"
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        # Retry-After is ignored: a throttled feed may ask for hours, and the
+        # news tab should fall back to cached entries instead of sleeping.
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=False,
+        ),
+    ),
+)
+
+# limit -> (monotonic fetch time, items).
+_NEWS_CACHE: dict[int, tuple[float, list[dict[str, str]]]] = {}
+# url -> (validator headers, (title, link) pairs) from the last successful download.
+_FEED_CACHE: dict[str, tuple[dict[str, str], list[tuple[str, str]]]] = {}
+
+
+def _parse_entries(body: bytes) -> list[tuple[str, str]]:
+    """Extract ``(title, link)`` pairs from the first items of an RSS or Atom feed."""
+    root = ET.fromstring(body)
+    entries = []
+    for item in root.iter("item"):
+        entries.append((item.findtext("title", ""), item.findtext("link", "")))
+        if len(entries) == ITEMS_PER_FEED:
+            return entries
+    for entry in root.iter(f"{ATOM}entry"):
+        link = entry.find(f"{ATOM}link")
+        href = link.get("href", "") if link is not None else ""
+        entries.append((entry.findtext(f"{ATOM}title", ""), href))
+        if len(entries) == ITEMS_PER_FEED:
+            break
+    return entries
+
+
+def _fetch_entries(url: str) -> list[tuple[str, str]]:
+    """Download and parse one feed, returning no entries when it is unreachable.
+
+    Feeds are revalidated with ``If-None-Match``/``If-Modified-Since`` so an
+    unchanged feed costs a 304 and skips parsing entirely.
+    """
+    validators, cached = _FEED_CACHE.get(url, ({}, []))
+    try:
+        response = SESSION.get(url, headers=validators, timeout=10)
+        if response.status_code == 304:
+            return cached
+        response.raise_for_status()
+        entries = _parse_entries(response.content)
+    except (requests.RequestException, ET.ParseError):
+        return cached
+    fresh: dict[str, str] = {}
+    if etag := response.headers.get("ETag"):
+        fresh["If-None-Match"] = etag
+    if modified := response.headers.get("Last-Modified"):
+        fresh["If-Modified-Since"] = modified
+    _FEED_CACHE[url] = (fresh, entries)
+    return entries
 
 
-@lru_cache(maxsize=1)
 def fetch_news(limit: int = 30) -> list[dict[str, str]]:
-    """Return a curated list of news items from RSS feeds."""
-    items: list[dict[str, str]] = []
-    for source, url in FEEDS.items():
-        feed = feedparser.parse(url)
-        for entry in feed.entries[:15]:
-            items.append(
-                {
-                    "source": source,
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
-                }
-            )
-    return items[:limit]
+    """Return a curated list of news items from RSS feeds.
+
+    Feeds are downloaded concurrently and the result is reused for
+    ``NEWS_TTL`` seconds per *limit*.
+    """
+    now = time.monotonic()
+    cached = _NEWS_CACHE.get(limit)
+    if cached is not None and now - cached[0] < NEWS_TTL:
+        return cached[1]
+    with ThreadPoolExecutor(max_workers=len(FEEDS)) as pool:
+        feeds = list(pool.map(_fetch_entries, FEEDS.values()))
+    items = [
+        {"source": source, "title": title.strip(), "link": link.strip()}
+        for source, entries in zip(FEEDS, feeds, strict=True)
+        for title, link in entries
+    ][:limit]
+    _NEWS_CACHE[limit] = (now, items)
+    return items
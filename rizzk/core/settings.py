@@ -9,15 +9,25 @@ from dotenv import dotenv_values
 
 ENV_PATH = Path(".env")
 
+# (mtime_ns, parsed values) of the last read.
+_cache: tuple[int, Mapping[str, str]] | None = None
+
 
 def load_settings() -> Mapping[str, str]:
     """Load key/value pairs from the local environment file."""
-    if not ENV_PATH.exists():
+    global _cache
+    try:
+        mtime = ENV_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
-    return dotenv_values(ENV_PATH)
+    if _cache is None or _cache[0] != mtime:
+        _cache = (mtime, dotenv_values(ENV_PATH))
+    return _cache[1]
 
 
 def save_settings(kv: Mapping[str, str]) -> None:
     """Persist a dictionary of settings to the .env file."""
+    global _cache
     lines = [f"{key}={value}" for key, value in kv.items()]
     ENV_PATH.write_text("\n".join(lines), encoding="utf-8")
+    _cache = None
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
 
+import numpy as np
+
 
 def humanize_timestamp(ts: int) -> str:
     """Return a human readable timestamp string in UTC."""
     return datetime.fromtimestamp(ts, tz=UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+def humanize_timestamps(ts: Sequence[int] | np.ndarray) -> list[str]:
+    """Format many epoch-second timestamps like :func:`humanize_timestamp` in one pass."""
+    stamps = np.datetime_as_string(np.asarray(ts, dtype="datetime64[s]"), unit="s")
+    return [f"{stamp[:10]} {stamp[11:]} UTC" for stamp in stamps]
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import argparse
+import os
+import re
 import subprocess
 from pathlib import Path
 
@@ -18,16 +20,23 @@ TEMPLATES: dict[str, str] = {
     ),
     "readme": "# {{name}}\n\n## Overview\n\n{{summary}}\n",
 }
+PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write *text* to *path* so readers never observe a partially written file."""
+
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def fill(template: str, path: Path, **kwargs: str) -> None:
     """Render a template into *path*."""
 
-    text = TEMPLATES[template]
-    for key, value in kwargs.items():
-        text = text.replace(f"{{{{{key}}}}}", value)
+    text = PLACEHOLDER.sub(lambda m: kwargs.get(m[1], m[0]), TEMPLATES[template])
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+    atomic_write_text(path, text)
 
 
 def git_commit(path: Path, message: str) -> None:
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import heapq
 import os
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
@@ -15,54 +18,92 @@ VAULT = Path(os.getenv("RIZZK_VAULT", "obsidian")).resolve()
 EXPORTS = Path(os.getenv("RIZZK_EXPORTS", "obsidian/90_exports")).resolve()
 ROOT = Path(__file__).resolve().parents[1]
 GIT = ["git", "-C", str(ROOT)]
+DEBOUNCE_SECONDS = 5.0
+HEARTBEAT_SECONDS = 900.0  # snapshot every 15 minutes regardless of changes
+PUSHER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync-push")
 
 
 class DebouncedEventHandler(FileSystemEventHandler):
-    """Marks the vault as dirty whenever a file-system event fires."""
+    """Counts file-system events so a burst of edits becomes one snapshot."""
 
     def __init__(self) -> None:
-        self._dirty = False
+        self._events = 0
+        self._consumed = 0
         self._last_event: float | None = None
+        self._wake = threading.Event()
 
     def on_any_event(self, event: FileSystemEvent) -> None:  # type: ignore[override]
         if event.is_directory:
             return
-        self._dirty = True
-        self._last_event = time.time()
+        self._events += 1
+        self._last_event = time.monotonic()
+        self._wake.set()
 
     @property
     def dirty(self) -> bool:
-        return self._dirty
+        return self._events != self._consumed
 
-    def consume(self) -> None:
-        self._dirty = False
+    @property
+    def events(self) -> int:
+        return self._events
+
+    def consume(self, upto: int) -> None:
+        """Mark events up to *upto* as snapshotted; later ones keep the vault dirty."""
+        self._consumed = upto
 
     @property
     def last_event(self) -> float | None:
         return self._last_event
 
+    def wait(self, timeout: float) -> None:
+        """Block until the next event or *timeout* seconds, whichever comes first."""
+        self._wake.wait(timeout)
+        self._wake.clear()
+
+
+def _push() -> None:
+    try:
+        subprocess.run(GIT + ["push"], check=True)
+    except Exception as exc:  # pragma: no cover - best effort logging
+        print(f"[sync] git push skipped: {exc}", file=sys.stderr)
+
 
 def safe_commit(message: str) -> None:
-    """Commit and push if there are staged changes."""
+    """Commit and push if the working tree has changes."""
 
     try:
+        status = subprocess.run(
+            GIT + ["status", "--porcelain", "-z"], check=True, capture_output=True
+        )
+        if not status.stdout:
+            return
         subprocess.run(GIT + ["add", "-A"], check=True)
-        diff = subprocess.run(GIT + ["diff", "--cached", "--quiet"], check=False)
-        if diff.returncode != 0:
-            subprocess.run(GIT + ["commit", "-m", message], check=True)
-            subprocess.run(GIT + ["push"], check=True)
+        # With nothing to commit, git exits 1 and writes nothing to stderr.
+        commit = subprocess.run(
+            GIT + ["commit", "-q", "-m", message], check=False, capture_output=True, text=True
+        )
     except Exception as exc:  # pragma: no cover - best effort logging
-        print(f"[sync] git push skipped: {exc}", file=sys.stderr)
+        print(f"[sync] git commit skipped: {exc}", file=sys.stderr)
+        return
+    if commit.returncode != 0:
+        if commit.stderr:
+            print(f"[sync] git commit skipped: {commit.stderr.strip()}", file=sys.stderr)
+        return
+    PUSHER.submit(_push)
 
 
 def export_housekeeping(max_files: int = 500) -> None:
     """Keep export directory from growing unbounded."""
 
     EXPORTS.mkdir(parents=True, exist_ok=True)
-    files = sorted(EXPORTS.glob("*"), key=lambda p: p.stat().st_mtime, reverse=True)
-    for stale in files[max_files:]:
+    with os.scandir(EXPORTS) as it:
+        files = [entry for entry in it if entry.is_file()]
+    excess = len(files) - max_files
+    if excess <= 0:
+        return
+    for stale in heapq.nsmallest(excess, files, key=lambda entry: entry.stat().st_mtime):
         try:
-            stale.unlink()
+            os.unlink(stale.path)
         except FileNotFoundError:
             continue
 
@@ -76,22 +117,27 @@ def main() -> None:
     print(f"[sync] watching VAULT={VAULT}")
 
     try:
-        last_snapshot = 0.0
+        last_snapshot = float("-inf")
         while True:
-            time.sleep(2)
-            now = time.time()
-
-            if handler.dirty and handler.last_event and now - handler.last_event >= 5:
-                export_housekeeping()
-                safe_commit("chore(sync): vault snapshot")
-                handler.consume()
-                last_snapshot = now
+            now = time.monotonic()
+
+            if handler.dirty and handler.last_event is not None:
+                quiet = now - handler.last_event
+                if quiet >= DEBOUNCE_SECONDS:
+                    seen = handler.events
+                    export_housekeeping()
+                    safe_commit("chore(sync): vault snapshot")
+                    handler.consume(seen)
+                    last_snapshot = now
+                else:
+                    time.sleep(max(0.5, DEBOUNCE_SECONDS - quiet))
                 continue
 
-            if now - last_snapshot >= 900:  # snapshot every 15 minutes regardless of changes
+            if now - last_snapshot >= HEARTBEAT_SECONDS:
                 export_housekeeping()
                 safe_commit("chore(sync): heartbeat snapshot")
                 last_snapshot = now
+            handler.wait(HEARTBEAT_SECONDS - (time.monotonic() - last_snapshot))
     finally:
         observer.stop()
         observer.join()
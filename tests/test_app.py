@@ -0,0 +1,54 @@
+"""Checks for the Dash app's data helpers."""
+
+from __future__ import annotations
+
+import importlib
+
+import numpy as np
+import pytest
+
+from rizzk.core.indicators import atr, ema, rsi
+
+
+@pytest.fixture(scope="module")
+def app_module():
+    return importlib.import_module("app")
+
+
+def test_screener_uses_each_symbol_history(app_module, monkeypatch) -> None:
+    frames = {sym: app_module.source.get_ohlc(sym, days=200) for sym in ("AAPL", "MSFT", "META")}
+    frames["META"] = frames["META"].iloc[-15:].reset_index(drop=True)
+    frames["MSFT"] = frames["MSFT"].iloc[-60:].reset_index(drop=True)
+    monkeypatch.setattr(app_module, "get_prices", frames.__getitem__)
+
+    table = app_module.build_screener.uncached(tuple(frames))
+
+    assert table["Symbol"].tolist() == ["AAPL", "MSFT"]
+    for row in table.itertuples(index=False):
+        df = frames[row.Symbol]
+        close = df["close"].astype(float)
+        high, low = df["high"].astype(float), df["low"].astype(float)
+        expected = [
+            close.iloc[-1],
+            rsi(close, 14).iloc[-1],
+            ema(close, 20).iloc[-1],
+            atr(high, low, close, 14).iloc[-1],
+        ]
+        np.testing.assert_allclose(
+            [row.Close, row.RSI, row.EMA20, row.ATR], np.round(expected, 2), atol=1e-9
+        )
+
+
+def test_screener_empty_watchlist(app_module) -> None:
+    table = app_module.build_screener.uncached(())
+    assert table.empty
+    assert list(table.columns) == app_module.SCREENER_COLUMNS
+
+
+@pytest.mark.parametrize("n", [0, 1, 1999, 2000, 2001, 3999, 10000])
+def test_plot_slice_bounds_and_keeps_last_bar(app_module, n: int) -> None:
+    kept = np.arange(n)[app_module.plot_slice(n)]
+    assert len(kept) <= app_module.MAX_PLOT_POINTS
+    if n:
+        assert kept[-1] == n - 1
+        assert np.all(np.diff(kept) > 0)
@@ -0,0 +1,15 @@
+"""Checks for the demo data source."""
+
+from __future__ import annotations
+
+from rizzk.core.data import YFinanceSource
+
+
+def test_demo_frames_are_deterministic_and_independent() -> None:
+    source = YFinanceSource()
+    first = source.get_ohlc("AAPL")
+    original = first.loc[0, "close"]
+    first.loc[0, "close"] = 1.0
+    second = source.get_ohlc("AAPL")
+    assert second.loc[0, "close"] == original
+    assert len(second) == 200
@@ -0,0 +1,58 @@
+"""Checks for the SQLite connection pool."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from rizzk.core.db import ConnectionPool
+
+
+def test_pool_readers_see_writes_but_cannot_write(tmp_path) -> None:
+    pool = ConnectionPool(
+        tmp_path / "pool.db",
+        readers=2,
+        init=lambda conn: conn.execute("CREATE TABLE t (v INTEGER)"),
+    )
+    with pool.writer() as conn:
+        conn.execute("INSERT INTO t VALUES (1)")
+    with pool.reader() as first, pool.reader() as second:
+        assert first is not second
+        assert first.execute("SELECT v FROM t").fetchall() == [(1,)]
+        with pytest.raises(sqlite3.OperationalError):
+            second.execute("INSERT INTO t VALUES (2)")
+    with pool.reader() as again:
+        assert again in (first, second)
+
+
+def test_pool_recovers_reader_slot_after_failed_open(tmp_path, monkeypatch) -> None:
+    pool = ConnectionPool(tmp_path / "pool.db", readers=1)
+    real_open = pool._open_reader
+
+    def failing_open() -> sqlite3.Connection:
+        raise sqlite3.OperationalError("unable to open database file")
+
+    monkeypatch.setattr(pool, "_open_reader", failing_open)
+    for _ in range(2):
+        with pytest.raises(sqlite3.OperationalError), pool.reader():
+            pass
+    monkeypatch.setattr(pool, "_open_reader", real_open)
+    with pool.reader() as conn:
+        assert conn.execute("SELECT 1").fetchone() == (1,)
+    pool.close()
+
+
+def test_data_version_tracks_writes_without_waiting_on_writer(tmp_path) -> None:
+    pool = ConnectionPool(
+        tmp_path / "pool.db",
+        init=lambda conn: conn.execute("CREATE TABLE t (v INTEGER)"),
+    )
+    before = pool.data_version()
+    with pool.writer() as conn:
+        conn.execute("INSERT INTO t VALUES (1)")
+        # Still holding the write lock: the probe must answer anyway.
+        assert pool.data_version() != before
+    pool.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        pool._writer.execute("SELECT 1")
@@ -0,0 +1,51 @@
+"""Checks for the NumPy indicator kernels."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from rizzk.core.indicators import atr, ema, latest_indicators, rsi
+
+# Wilder's 14-period example as published by StockCharts (RSI from bar 14 on).
+# fmt: off
+WILDER_CLOSES = [
+    44.3389, 44.0902, 44.1497, 43.6124, 44.3278, 44.8264, 45.0955, 45.4245, 45.8433, 46.0826,
+    45.8931, 46.0328, 45.6140, 46.2820, 46.2820, 46.0028, 46.0328, 46.4116, 46.2222, 45.6439,
+]
+# fmt: on
+WILDER_RSI = [70.53, 66.32, 66.55, 69.41, 66.36, 57.97]
+
+
+def test_rsi_matches_published_wilder_values() -> None:
+    closes = pd.Series(WILDER_CLOSES, index=range(10, 30))
+    result = rsi(closes, 14)
+    assert result.index.equals(closes.index)
+    assert result.iloc[:14].isna().all()
+    np.testing.assert_allclose(result.iloc[14:].round(2), WILDER_RSI)
+    matrix = np.array([WILDER_CLOSES])
+    assert round(latest_indicators(matrix, matrix, matrix)[0][0], 2) == WILDER_RSI[-1]
+
+
+def test_rsi_edge_cases() -> None:
+    rising = pd.Series(np.arange(30, dtype=float))
+    assert rsi(rising, 14).iloc[-1] == 100.0
+    flat = pd.Series(np.full(30, 5.0))
+    assert rsi(flat, 14).iloc[-1] == 50.0
+    assert rsi(pd.Series(np.arange(14, dtype=float)), 14).isna().all()
+
+
+def test_latest_indicators_match_series_tails() -> None:
+    rng = np.random.default_rng(11)
+    close = rng.normal(0, 1, (3, 60)).cumsum(axis=1) + 100
+    rsi_last, ema_last, atr_last = latest_indicators(close, close + 1.0, close - 1.0)
+    for row, values in enumerate(close):
+        series = pd.Series(values)
+        assert np.isclose(rsi_last[row], rsi(series, 14).iloc[-1])
+        assert np.isclose(ema_last[row], ema(series, 20).iloc[-1])
+        assert np.isclose(atr_last[row], atr(series + 1.0, series - 1.0, series, 14).iloc[-1])
+    seeded = pd.Series(np.r_[close[0, :20].mean(), close[0, 20:]])
+    expected_ema = seeded.ewm(alpha=2 / 21, adjust=False).mean().iloc[-1]
+    assert np.isclose(ema_last[0], expected_ema)
+    short = latest_indicators(close[:, :5], close[:, :5], close[:, :5])
+    assert all(np.isnan(values).all() for values in short)
@@ -0,0 +1,55 @@
+"""Checks for the SQLite-backed journal."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import closing
+
+import pytest
+
+from rizzk.core import journal
+
+
+@pytest.fixture(autouse=True)
+def journal_db(tmp_path, monkeypatch) -> Iterator[None]:
+    monkeypatch.setattr(journal, "DB_PATH", tmp_path / "journal.db")
+    journal._pool.cache_clear()
+    journal._recent_entries.cache_clear()
+    yield
+    journal._pool().close()
+    journal._pool.cache_clear()
+    journal._recent_entries.cache_clear()
+
+
+def test_add_entries_returns_ids_of_inserted_rows() -> None:
+    texts = [f"entry {i}" for i in range(journal.BATCH_SIZE * 2 + 7)]
+    ids = journal.add_entries(texts)
+    assert len(ids) == len(texts)
+    with closing(sqlite3.connect(journal.DB_PATH)) as conn:
+        rows = dict(conn.execute("SELECT id, body FROM journal").fetchall())
+    assert [rows[i] for i in ids] == texts
+
+
+def test_add_entries_rejects_blank_bodies() -> None:
+    with pytest.raises(ValueError):
+        journal.add_entries(["ok", "   "])
+    assert journal.list_entries() == []
+
+
+def test_listing_refreshes_after_add_and_delete() -> None:
+    first = journal.add_entry("first")
+    assert [e["body"] for e in journal.list_entries()] == ["first"]
+    journal.add_entry("second")
+    assert [e["body"] for e in journal.list_entries()] == ["second", "first"]
+    journal.delete_entry(first)
+    assert [e["body"] for e in journal.list_entries()] == ["second"]
+
+
+def test_listing_refreshes_after_external_commit() -> None:
+    journal.add_entry("mine")
+    assert len(journal.list_entries()) == 1
+    with closing(sqlite3.connect(journal.DB_PATH)) as conn, conn:
+        conn.execute("INSERT INTO journal(ts, body) VALUES(?, ?)", (int(time.time()) + 1, "theirs"))
+    assert [e["body"] for e in journal.list_entries()] == ["theirs", "mine"]
@@ -0,0 +1,23 @@
+"""Checks for RSS/Atom parsing."""
+
+from __future__ import annotations
+
+from rizzk.core.news import ITEMS_PER_FEED, _parse_entries
+
+
+def test_parse_rss_items() -> None:
+    items = "".join(
+        f"<item><title>T{i}</title><link>https://x/{i}</link></item>" for i in range(20)
+    )
+    body = f"<?xml version='1.0'?><rss><channel><title>Feed</title>{items}</channel></rss>"
+    entries = _parse_entries(body.encode())
+    assert len(entries) == ITEMS_PER_FEED
+    assert entries[0] == ("T0", "https://x/0")
+
+
+def test_parse_atom_entries() -> None:
+    body = (
+        b'<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>'
+        b'<entry><title>A</title><link href="https://x/a"/></entry></feed>'
+    )
+    assert _parse_entries(body) == [("A", "https://x/a")]